@@ -13,9 +13,10 @@
 """Contains the Deprecation message methods."""
 
 from abc import abstractmethod
+import sys
 import warnings
 import functools
-from typing import NamedTuple, Optional, Callable, Dict, Set
+from typing import Optional, Callable, Dict, Set, Tuple
 from enum import Enum, EnumMeta
 
 
@@ -24,10 +25,13 @@ class DeprecatedEnum(Enum):
     Shows deprecate message whenever member is accessed
     """
 
+    __slots__ = ("_value_", "_args", "_show_deprecate")
+
     def __new__(cls, value, *args):
         member = object.__new__(cls)
         member._value_ = value
         member._args = args
+        # cleared once the message was shown, since it is only ever emitted once
         member._show_deprecate = member.deprecate
         return member
 
@@ -37,34 +41,63 @@ class DeprecatedEnum(Enum):
         pass
 
 
+class _DeprecatedMember:
+    """
+    Class attribute of a deprecated enum that shows the deprecate message of its member
+    """
+
+    def __init__(self, member):
+        self._member = member
+
+    def __get__(self, instance, owner=None):
+        member = self._member
+        show_deprecate = member._show_deprecate
+        if show_deprecate is not None:
+            member._show_deprecate = None
+            show_deprecate()
+        return member
+
+
 class DeprecatedEnumMeta(EnumMeta):
     """
     Shows deprecate message whenever member is accessed
     """
 
-    def __getattribute__(cls, name):
-        obj = super().__getattribute__(name)
-        if isinstance(obj, DeprecatedEnum) and obj._show_deprecate:
-            obj._show_deprecate()
-        return obj
+    def __new__(mcs, cls, bases, classdict, **kwds):
+        enum_class = super().__new__(mcs, cls, bases, classdict, **kwds)
+        # Only the member attributes need to warn, so they are wrapped individually instead of
+        # intercepting every attribute lookup on the class.
+        for name, member in enum_class._member_map_.items():
+            if enum_class.__dict__.get(name) is member:
+                # EnumMeta.__setattr__ refuses to reassign members
+                type.__setattr__(enum_class, name, _DeprecatedMember(member))
+        return enum_class
 
     def __getitem__(cls, name):
         member = super().__getitem__(name)
-        if member._show_deprecate:
-            member._show_deprecate()
+        show_deprecate = member._show_deprecate
+        if show_deprecate is not None:
+            member._show_deprecate = None
+            show_deprecate()
         return member
 
     # pylint: disable=redefined-builtin
     def __call__(cls, value, names=None, *, module=None, qualname=None, type=None, start=1):
-        obj = super().__call__(
-            value, names, module=module, qualname=qualname, type=type, start=start
-        )
-        if isinstance(obj, DeprecatedEnum) and obj._show_deprecate:
-            obj._show_deprecate()
-        return obj
+        if names is not None:
+            # functional API, creates a new enum class
+            return super().__call__(
+                value, names, module=module, qualname=qualname, type=type, start=start
+            )
 
+        member = super().__call__(value)
+        show_deprecate = member._show_deprecate
+        if show_deprecate is not None:
+            member._show_deprecate = None
+            show_deprecate()
+        return member
 
-class DeprecatedType(Enum):
+
+class DeprecatedType(str, Enum):
     """ " Deprecation Types"""
 
     PACKAGE = "package"
@@ -75,17 +108,19 @@ class DeprecatedType(Enum):
     ARGUMENT = "argument"
     PROPERTY = "property"
 
+    def __format__(self, format_spec):
+        # members format as their string values, so they can be used directly in messages
+        return str.__format__(self.value, format_spec)
+
 
-class _DeprecatedObject(NamedTuple):
-    version: str
-    old_type: DeprecatedType
-    old_name: str
-    new_type: DeprecatedType
-    new_name: str
-    additional_msg: str
+_MSG_TMPL = (
+    "{} {} {} is deprecated as of version {} "
+    "and will be removed no sooner than 3 months after the release{}."
+)
+_INSTEAD_TMPL = ". Instead use the {} {}"
 
 
-_DEPRECATED_OBJECTS: Set[_DeprecatedObject] = set()
+_DEPRECATED_OBJECTS: Set[Tuple[str, DeprecatedType]] = set()
 
 
 def warn_deprecated(
@@ -107,23 +142,17 @@ def warn_deprecated(
         additional_msg: any additional message
         stack_level: stack level
     """
-    # skip if it was already added
-    obj = _DeprecatedObject(version, old_type, old_name, new_type, new_name, additional_msg)
-    if obj in _DEPRECATED_OBJECTS:
+    # skip if it was already added, the old name and type identify the deprecated object
+    key = (old_name, old_type)
+    if key in _DEPRECATED_OBJECTS:
         return
 
-    _DEPRECATED_OBJECTS.add(obj)
+    _DEPRECATED_OBJECTS.add(key)
 
-    msg = (
-        f"The {old_name} {old_type.value} is deprecated as of version {version} "
-        "and will be removed no sooner than 3 months after the release"
-    )
-    if new_type is not None and new_name:
-        msg += f". Instead use the {new_name} {new_type.value}"
-    if additional_msg:
-        msg += f" {additional_msg}"
-    msg += "."
+    if not _should_warn(DeprecationWarning, stack_level + 1):
+        return
 
+    msg = _deprecation_msg("The", old_name, old_type, version, new_type, new_name, additional_msg)
     warnings.warn(msg, DeprecationWarning, stacklevel=stack_level + 1)
 
 
@@ -148,7 +177,49 @@ def warn_deprecated_same_type_name(
     )
 
 
-def _rename_kwargs(version, func_name, kwargs, kwarg_map, additional_msg, stack_level):
+def _should_warn(category, stacklevel):
+    # Tells whether warnings.warn(msg, category, stacklevel) issued by the caller of this
+    # function would show anything, so that building the message can be skipped when the
+    # filters ignore it. Only filters without message or line number restrictions are decided
+    # here, any other filter that may apply is assumed to show the warning.
+    # pylint: disable=protected-access
+    frame = sys._getframe(1)
+    for _ in range(stacklevel - 1):
+        frame = frame.f_back
+        # skip the import machinery like warnings.warn does
+        while frame is not None and (
+            "importlib" in frame.f_code.co_filename and "_bootstrap" in frame.f_code.co_filename
+        ):
+            frame = frame.f_back
+        if frame is None:
+            return True
+
+    module = frame.f_globals.get("__name__", "<string>")
+    for action, msg, cat, mod, lineno in warnings.filters:
+        if not issubclass(category, cat):
+            continue
+        if msg is not None or lineno:
+            return True
+        if isinstance(mod, str):
+            # the default filters hold plain strings, which are compared for equality
+            if mod != module:
+                continue
+        elif mod is not None and not mod.match(module):  # pylint: disable=no-member
+            continue
+        return action != "ignore"
+    return warnings.defaultaction != "ignore"
+
+
+def _deprecation_msg(prefix, old_name, old_type, version, new_type, new_name, additional_msg):
+    tail = ""
+    if new_type is not None and new_name:
+        tail = _INSTEAD_TMPL.format(new_name, new_type)
+    if additional_msg:
+        tail += " " + additional_msg
+    return _MSG_TMPL.format(prefix, old_name, old_type, version, tail)
+
+
+def _rename_kwargs(func_name, kwargs, kwarg_map, messages, stack_level):
     for old_arg, new_arg in kwarg_map.items():
         if old_arg in kwargs:
             if new_arg in kwargs:
@@ -156,16 +227,7 @@ def _rename_kwargs(version, func_name, kwargs, kwarg_map, additional_msg, stack_
                     "{} received both {} and {} (deprecated).".format(func_name, new_arg, old_arg)
                 )
 
-            msg = (
-                f"{func_name}: the {old_arg} {DeprecatedType.ARGUMENT.value} is deprecated "
-                f"as of version {version} and will be removed no sooner "
-                "than 3 months after the release. Instead use the "
-                f"{new_arg} {DeprecatedType.ARGUMENT.value}"
-            )
-            if additional_msg:
-                msg += f" {additional_msg}"
-            msg += "."
-            warnings.warn(msg, DeprecationWarning, stacklevel=stack_level)
+            warnings.warn(messages[old_arg], DeprecationWarning, stacklevel=stack_level)
             kwargs[new_arg] = kwargs.pop(old_arg)
 
 
@@ -187,12 +249,26 @@ def deprecate_arguments(
     """
 
     def decorator(func):
+        func_name = func.__name__
+        # the messages only depend on the decorated function, so build them once
+        messages = {
+            old_arg: _deprecation_msg(
+                f"{func_name}: the",
+                old_arg,
+                DeprecatedType.ARGUMENT,
+                version,
+                DeprecatedType.ARGUMENT,
+                new_arg,
+                additional_msg,
+            )
+            for old_arg, new_arg in kwarg_map.items()
+        }
+        old_args = frozenset(kwarg_map)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if kwargs:
-                _rename_kwargs(
-                    version, func.__name__, kwargs, kwarg_map, additional_msg, stack_level
-                )
+            if kwargs and not old_args.isdisjoint(kwargs):
+                _rename_kwargs(func_name, kwargs, kwarg_map, messages, stack_level)
             return func(*args, **kwargs)
 
         return wrapper
@@ -220,25 +296,27 @@ def deprecate_method(
     """
 
     def decorator(method):
-        msg = (
-            f"The {method.__name__} {DeprecatedType.METHOD.value} is deprecated "
-            f"as of version {version} and will be removed no sooner "
-            "than 3 months after the release. Instead use the "
-            f"{new_name} {new_type.value}"
+        msg = _deprecation_msg(
+            "The",
+            method.__name__,
+            DeprecatedType.METHOD,
+            version,
+            new_type,
+            new_name,
+            additional_msg,
         )
-        if additional_msg:
-            msg += f" {additional_msg}"
-        msg += "."
+
+        warned = False
 
         @functools.wraps(method)
         def wrapper(self, *method_args, **method_kwargs):
+            nonlocal warned
             # warn only once
-            if not wrapper._warned:
+            if not warned:
                 warnings.warn(msg, DeprecationWarning, stacklevel=stack_level)
-                wrapper._warned = True
+                warned = True
             return method(self, *method_args, **method_kwargs)
 
-        wrapper._warned = False
         return wrapper
 
     return decorator
@@ -264,25 +342,27 @@ def deprecate_function(
     """
 
     def decorator(func):
-        msg = (
-            f"The {func.__name__} {DeprecatedType.FUNCTION.value} is deprecated "
-            f"as of version {version} and will be removed no sooner "
-            "than 3 months after the release. Instead use the "
-            f"{new_name} {new_type.value}"
+        msg = _deprecation_msg(
+            "The",
+            func.__name__,
+            DeprecatedType.FUNCTION,
+            version,
+            new_type,
+            new_name,
+            additional_msg,
         )
-        if additional_msg:
-            msg += f" {additional_msg}"
-        msg += "."
+
+        warned = False
 
         @functools.wraps(func)
         def wrapper(*method_args, **method_kwargs):
+            nonlocal warned
             # warn only once
-            if not wrapper._warned:
+            if not warned:
                 warnings.warn(msg, DeprecationWarning, stacklevel=stack_level)
-                wrapper._warned = True
+                warned = True
             return func(*method_args, **method_kwargs)
 
-        wrapper._warned = False
         return wrapper
 
     return decorator
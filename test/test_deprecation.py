@@ -14,11 +14,16 @@
 Test The deprecation methods
 """
 
+from abc import ABC, abstractmethod
+import typing
 import unittest
+from unittest.mock import patch
 import warnings
 from test import QiskitNatureTestCase
 from ddt import data, ddt
 from qiskit_nature.deprecation import (
+    DeprecatedEnum,
+    DeprecatedEnumMeta,
     DeprecatedType,
     warn_deprecated,
     warn_deprecated_same_type_name,
@@ -91,6 +96,43 @@ class TestClass:
         pass
 
 
+def warn_class_deprecated(name):
+    """warn about the deprecated class name on behalf of the caller"""
+    warn_deprecated("0.3.0", DeprecatedType.CLASS, name, stack_level=2)
+
+
+def warn_class_deprecated_from(module_name, name):
+    """call warn_class_deprecated from code running in the module module_name"""
+    # pylint: disable=exec-used
+    exec(
+        "warn_class_deprecated(name)",
+        {"__name__": module_name, "warn_class_deprecated": warn_class_deprecated, "name": name},
+    )
+
+
+class AbstractTestClass(ABC):
+    """Abstract test class with deprecation"""
+
+    @deprecate_method("0.1.0", DeprecatedType.METHOD, "some_method4")
+    @abstractmethod
+    def method4(self, arg4: int) -> int:
+        """method 4"""
+        raise NotImplementedError()
+
+
+class DeprecatedEnum1(DeprecatedEnum, metaclass=DeprecatedEnumMeta):
+    """Deprecated Test enum 1"""
+
+    VALUE1 = "value1"
+    VALUE2 = "value2"
+
+    def deprecate(self):
+        """show deprecate message"""
+        warn_deprecated_same_type_name(
+            "0.3.0", DeprecatedType.ENUM, self.__class__.__name__, "from package test3", 3
+        )
+
+
 @ddt
 class TestDeprecation(QiskitNatureTestCase):
     """Test deprecation methods"""
@@ -171,6 +213,37 @@ class TestDeprecation(QiskitNatureTestCase):
             DeprecatedClass2()
             self.assertListEqual(c_m, [])
 
+    def test_enum_deprecation(self):
+        """test enum deprecation"""
+
+        msg_ref = (
+            "The DeprecatedEnum1 enum is deprecated as of version 0.3.0 "
+            "and will be removed no sooner than 3 months after the release. "
+            "Instead use the DeprecatedEnum1 enum from package test3."
+        )
+
+        # accessing the class itself should not emit deprecation
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("always")
+            self.assertEqual(len(DeprecatedEnum1.__members__), 2)
+            self.assertListEqual(c_m, [])
+
+        # emit deprecation the first time a member is used
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("always")
+            member = DeprecatedEnum1.VALUE1
+            msg = str(c_m[0].message)
+            self.assertEqual(msg, msg_ref)
+            self.assertEqual(c_m[0].filename, __file__)
+
+        # trying again should not emit deprecation
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("always")
+            self.assertIs(DeprecatedEnum1.VALUE1, member)
+            self.assertIs(DeprecatedEnum1["VALUE2"], DeprecatedEnum1.VALUE2)
+            self.assertIs(DeprecatedEnum1("value2"), DeprecatedEnum1.VALUE2)
+            self.assertListEqual(c_m, [])
+
     @data(
         (
             "method1",
@@ -204,6 +277,100 @@ class TestDeprecation(QiskitNatureTestCase):
             method()
             self.assertListEqual(c_m, [])
 
+    def test_deprecated_type(self):
+        """test deprecation types format as their values"""
+
+        self.assertEqual(f"{DeprecatedType.ENUM}", "enum")
+        # pylint: disable=consider-using-f-string
+        self.assertEqual("{}".format(DeprecatedType.CLASS), "class")
+        self.assertEqual(str(DeprecatedType.METHOD), "DeprecatedType.METHOD")
+        self.assertEqual(DeprecatedType.FUNCTION.value, "function")
+        self.assertIs(DeprecatedType("argument"), DeprecatedType.ARGUMENT)
+
+    def test_ignored_deprecation(self):
+        """test deprecation ignored by the warning filters"""
+
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("ignore")
+            with patch("warnings.warn") as warn:
+                warn_class_deprecated_from("application", "IgnoredClass")
+                warn.assert_not_called()
+            self.assertListEqual(c_m, [])
+
+        # the deprecation counts as shown even though it was ignored
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("always")
+            warn_class_deprecated_from("application", "IgnoredClass")
+            self.assertListEqual(c_m, [])
+
+    def test_deprecation_module_filter(self):
+        """test deprecation with a filter restricted to some modules"""
+
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("always")
+            warnings.filterwarnings("ignore", category=DeprecationWarning, module=r"library\.")
+            warn_class_deprecated_from("library.module", "LibraryClass1")
+            self.assertListEqual(c_m, [])
+            warn_class_deprecated_from("application", "LibraryClass2")
+            self.assertEqual(len(c_m), 1)
+            self.assertIn("LibraryClass2", str(c_m[0].message))
+
+    def test_deprecation_message_filter(self):
+        """test deprecation shown by a message filter over an ignore filter"""
+
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("ignore")
+            warnings.filterwarnings("always", message="The MessageClass class")
+            warn_class_deprecated_from("application", "MessageClass")
+            self.assertEqual(len(c_m), 1)
+            self.assertIn("MessageClass", str(c_m[0].message))
+
+        # an ignore filter for other messages must not hide the deprecation
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.simplefilter("always")
+            warnings.filterwarnings("ignore", message="The OtherClass class")
+            warn_class_deprecated_from("application", "UnrelatedMessageClass")
+            self.assertEqual(len(c_m), 1)
+            self.assertIn("UnrelatedMessageClass", str(c_m[0].message))
+
+    def test_deprecation_default_filters(self):
+        """test deprecation with the default warning filters"""
+
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.resetwarnings()
+            # the filters the interpreter installs, which match the module by plain string
+            warnings.filters.extend(
+                [
+                    ("default", None, DeprecationWarning, "__main__", 0),
+                    ("ignore", None, DeprecationWarning, None, 0),
+                ]
+            )
+            warn_class_deprecated_from("__main__", "MainClass")
+            self.assertEqual(len(c_m), 1)
+            self.assertIn("MainClass", str(c_m[0].message))
+            warn_class_deprecated_from("library", "DefaultLibraryClass")
+            self.assertEqual(len(c_m), 1)
+
+        # without any filter the default action applies, which shows the warning
+        with warnings.catch_warnings(record=True) as c_m:
+            warnings.resetwarnings()
+            warn_class_deprecated_from("library", "UnfilteredClass")
+            self.assertEqual(len(c_m), 1)
+            self.assertIn("UnfilteredClass", str(c_m[0].message))
+
+    def test_abstract_method_deprecation(self):
+        """test deprecation of an abstract method keeps it abstract"""
+
+        self.assertEqual(AbstractTestClass.__abstractmethods__, frozenset({"method4"}))
+        with self.assertRaises(TypeError):
+            # pylint: disable=abstract-class-instantiated
+            AbstractTestClass()  # type: ignore
+
+        self.assertEqual(AbstractTestClass.method4.__doc__, "method 4")
+        self.assertDictEqual(
+            typing.get_type_hints(AbstractTestClass.method4), {"arg4": int, "return": int}
+        )
+
     def test_function_arguments_deprecation(self):
         """test function arguments deprecation"""
 